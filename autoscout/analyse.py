@@ -2,19 +2,39 @@
 Apply algorithms to data to identify patterns and insights.
 """
 
+import hashlib
 import itertools
-from typing import Dict, Sequence, Union
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from numpy.typing import ArrayLike
-from sklearn.base import BaseEstimator
-from sklearn.cluster import KMeans
+from sklearn.base import BaseEstimator, clone
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.decomposition import PCA
-from sklearn.preprocessing import minmax_scale
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MinMaxScaler, minmax_scale
 
 from autoscout import preprocess, util
 
+# opt in to Intel's accelerated drop-in replacements for the estimators fitted here
+if os.environ.get("AUTOSCOUT_USE_SKLEARNEX") == "1":
+    try:
+        from sklearnex.cluster import KMeans
+        from sklearnex.decomposition import PCA
+    except ImportError:
+        pass
+
+# datasets with at least this many rows use mini-batch KMeans during k selection
+MINI_BATCH_MIN_ROWS = 5000
+
+# fits from previous elbow tests, keyed by data fingerprint, estimator and k
+INERTIA_CACHE_SIZE = 256
+_inertia_cache: "OrderedDict[Tuple, Tuple[float, np.ndarray]]" = OrderedDict()
+
 
 def estimate_style_ratings(
     data: pd.DataFrame,
@@ -42,8 +62,6 @@ def estimate_style_ratings(
         given by `f"{rating}_rating"`, with {rating} the name specified in `config`.
     """
 
-    data = data.copy(deep=True)
-
     relevant_columns = list(set(itertools.chain(*config.values())))
 
     data = preprocess.adjust_per_90(data, relevant_columns)
@@ -67,6 +85,8 @@ def reduce_dimensions(
     used for reduction. Otherwise, automatically fitting PCA is supported.
 
     Input `data` is min-max scaled but not adjusted per-90 minutes prior to reduction.
+    If the reducer is fitted automatically, features are also cast to `float32`;
+    existing reducers receive features of the dtype they were fitted on.
 
     Args:
         data: DataFrame containing input data.
@@ -79,23 +99,27 @@ def reduce_dimensions(
         To include this as a column: `data["cluster"] = reduce_dimensions(data, ...)`.
     """
 
-    data = util.min_max_scale(data, columns)
-
     if isinstance(reducer, int):
-        reducer = fit_pca(data, columns, reducer)
+        features = _scaled_features(data, columns)
+        reducer = fit_pca(features, columns, reducer)
+    else:
+        features = _scaled_features(data, columns, dtype=_fitted_dtype(reducer))
 
-    return reducer.transform(data[columns])
+    return reducer.transform(features)
 
 
 def fit_pca(
     data: pd.DataFrame, columns: Sequence[str], out_dimensions: int = 1
-) -> KMeans:
+) -> PCA:
     """
     Fit a PCA dimensionality reduction model to `data`, using `columns` as features.
 
     Data is not preprocessed. It may be useful to min-max scale the data or adjust
     per 90 minutes prior to passing it to this function.
 
+    Randomized SVD is used when `out_dimensions` is small relative to the data, as it
+    is much cheaper than a full SVD on wide feature sets. Otherwise a full SVD is used.
+
     Args:
         data: DataFrame containing data to fit estimator.
         columns: Names of columns to use as clustering features.
@@ -105,7 +129,16 @@ def fit_pca(
         Fitted PCA estimator.
     """
 
-    estimator = PCA(n_components=out_dimensions)
+    if out_dimensions >= min(len(data), len(columns)) // 2:
+        estimator = PCA(n_components=out_dimensions, svd_solver="full")
+    else:
+        estimator = PCA(
+            n_components=out_dimensions,
+            svd_solver="randomized",
+            n_oversamples=5,
+            random_state=0,
+        )
+
     estimator.fit(data[columns])
     return estimator
 
@@ -121,10 +154,17 @@ def cluster_records(
     an already prepared model. Otherwise, automatically fitting KMeans is supported.
 
     Input `data` is min-max scaled but not adjusted per-90 minutes, prior to being
-    clustered. It is possible, and sometimes beneficial, to apply clustering to data
-    which has already been dimensionality reduced. To do this, include the outputs of
+    clustered. If the estimator is fitted automatically, features are also cast to
+    `float32`; existing estimators receive features of the dtype they were fitted on,
+    as a KMeans cannot predict on input of a different float type.
+
+    It is possible, and sometimes beneficial, to apply clustering to data which has
+    already been dimensionality reduced. To do this, include the outputs of
     dimensionality reduction as columns in `data`, then pass them as `columns`.
 
+    If `estimator` is a `Pipeline`, such as one from `build_cluster_pipeline()`, it is
+    assumed to perform its own scaling and receives `data[columns]` unscaled.
+
     Args:
         data: DataFrame containing input data.
         columns: Names of columns to use as features.
@@ -136,12 +176,75 @@ def cluster_records(
         column of `data`, use: `data["cluster"] = cluster_records(data, ...)`.
     """
 
-    data = util.min_max_scale(data, columns)
-
     if estimator == "auto":
-        estimator = fit_kmeans(data, columns)
+        features = _scaled_features(data, columns)
+        estimator = fit_kmeans(features, columns)
+    elif isinstance(estimator, Pipeline):
+        features = data[columns]
+    else:
+        features = _scaled_features(data, columns, dtype=_fitted_dtype(estimator))
+
+    return estimator.predict(features)
+
+
+def reduce_and_cluster(
+    data: pd.DataFrame,
+    columns: Sequence[str],
+    out_dimensions: int = 2,
+    n_clusters: int = 8,
+) -> np.ndarray:
+    """
+    Cluster the records in `data` after reducing the dimensions specified by
+    `columns`, in a single pass through a pipeline of min-max scaling, PCA and KMeans.
+    This avoids materialising the scaled and reduced features as DataFrames, as is
+    needed to chain `reduce_dimensions()` and `cluster_records()`.
+
+    Args:
+        data: DataFrame containing input data.
+        columns: Names of columns to use as features.
+        out_dimensions: Number of dimensions to reduce the features to.
+        n_clusters: Number of clusters to create.
+
+    Returns:
+        Array of cluster assignments, in order of rows in `data`.
+    """
+
+    pipeline = build_cluster_pipeline(n_clusters, out_dimensions=out_dimensions)
+    return pipeline.fit_predict(data[columns].to_numpy(dtype=np.float32))
 
-    return estimator.predict(data[columns])
+
+def build_cluster_pipeline(
+    n_clusters: int = 8,
+    out_dimensions: Optional[int] = None,
+    memory: Optional[str] = None,
+) -> Pipeline:
+    """
+    Build an unfitted `Pipeline` which min-max scales features, optionally reduces
+    their dimensions via PCA, then clusters them with KMeans. Fitting the pipeline
+    scales the data once and passes arrays straight between steps, without a
+    DataFrame roundtrip in between.
+
+    Args:
+        n_clusters: Number of clusters to create.
+        out_dimensions: Number of dimensions to reduce features to before clustering.
+            No reduction if `None`, as default.
+        memory: Directory in which to cache the fitted transformation steps, so
+            refitting on the same data skips them. See `sklearn.pipeline.Pipeline`.
+            No caching if `None`, as default.
+
+    Returns:
+        Unfitted Pipeline. Use `.fit_predict(data[columns])` to cluster records, or
+        fit it and pass it to `cluster_records()` as `estimator`.
+    """
+
+    steps = [("scale", MinMaxScaler())]
+
+    if out_dimensions is not None:
+        pca = PCA(n_components=out_dimensions, svd_solver="randomized", random_state=0)
+        steps.append(("reduce", pca))
+
+    steps.append(("cluster", KMeans(n_clusters=n_clusters)))
+    return Pipeline(steps, memory=memory)
 
 
 def fit_kmeans(
@@ -158,7 +261,8 @@ def fit_kmeans(
         data: DataFrame containing data to fit estimator.
         columns: Names of columns to use as clustering features.
         n_clusters: Number of clusters to create. If "auto", as default, the number
-            will be estimated via an elbow test.
+            will be estimated via an elbow test, and the final fit is initialised
+            from the centroids found for that number during the test.
 
     Returns:
         Fitted KMeans estimator.
@@ -167,19 +271,50 @@ def fit_kmeans(
     estimator = KMeans()
 
     if n_clusters == "auto":
-        n_clusters = _select_k_by_elbow_test(estimator, data[columns])
+        n_clusters, centers = _select_k_by_elbow_test(estimator, data[columns])
+        if centers is not None:
+            estimator.set_params(init=centers, n_init=1)
 
     estimator.n_clusters = n_clusters
     estimator.fit(data[columns])
     return estimator
 
 
+def _fitted_dtype(estimator: BaseEstimator) -> np.dtype:
+    """
+    Get the float type an existing `estimator` was fitted on, from its fitted cluster
+    centres or components, defaulting to `float64` if it has neither.
+    """
+
+    for attribute in ("cluster_centers_", "components_"):
+        fitted = getattr(estimator, attribute, None)
+        if fitted is not None and fitted.dtype.kind == "f":
+            return fitted.dtype
+    return np.dtype(np.float64)
+
+
+def _scaled_features(
+    data: pd.DataFrame, columns: Sequence[str], dtype: type = np.float32
+) -> pd.DataFrame:
+    """
+    Min-max scale `columns` from `data` with `util.min_max_scale()`, into a new
+    DataFrame containing only those columns, so that the rest of `data` does not need
+    to be copied. Values are cast to `dtype`. The default of `float32` is ample
+    precision for scaled features and halves the memory traffic of the estimators
+    consuming them.
+    """
+
+    columns = list(columns)
+    return util.min_max_scale(data[columns], columns, dtype=dtype)
+
+
 def _select_k_by_elbow_test(
     estimator: KMeans,
     data: ArrayLike,
     k_values: Sequence[int] = range(3, 30),
     relative: bool = True,
-) -> int:
+    n_jobs: int = -1,
+) -> Tuple[int, Optional[np.ndarray]]:
     """
     Estimate the best number of clusters (k) for KMeans clustering, based on `data`
     and `estimator`. The strength of each possible k in `k_values` is assessed based
@@ -198,43 +333,138 @@ def _select_k_by_elbow_test(
             what is in effect regularisation to cluster count selection, penalising
             larger numbers of clusters by dividing the strength value of all cluster
             counts by the count itself.
+        n_jobs: Number of parallel jobs used to fit the candidate estimators. Each
+            value of k is fitted independently. `-1` uses all available cores.
 
     Returns:
-        Optimal k value for KMeans clustering using elbow test.
+        Tuple of optimal k value for KMeans clustering using elbow test, and the
+        cluster centres fitted for that k, which can be used to initialise a final
+        fit. If no elbow is found, k is 0 and the centres are `None`.
     """
 
     clusters = np.array(k_values)
-    ssd = list(map(lambda k: _get_inertia(estimator, data, k), k_values))
+    fits = _get_inertias_cached(estimator, data, k_values, n_jobs)
+    ssd = np.fromiter(
+        (inertia for inertia, _ in fits), dtype=np.float64, count=len(fits)
+    )
+
+    best = _pick_k_from_ssd(ssd, clusters, relative)
+    if best is None:
+        return 0, None
+    return clusters[best], fits[best][1]
+
+
+def _pick_k_from_ssd(
+    ssd: np.ndarray, k_values: np.ndarray, relative: bool = True
+) -> Optional[int]:
+    """
+    Find the position of the strongest elbow in the inertia curve `ssd`, where
+    `ssd[i]` is the inertia for `k_values[i]` clusters.
+
+    The strength at each position is the second difference of the curve there less
+    the first difference to the following position, computed in a single pass over
+    shifted views of `ssd`.
+
+    Args:
+        ssd: Inertia values, in the order of `k_values`.
+        k_values: Cluster counts which `ssd` was computed for.
+        relative: Divide strength by the cluster count. See
+            `_select_k_by_elbow_test()`.
+
+    Returns:
+        Index into `k_values` of the strongest elbow, or `None` if there is no
+        position with positive strength, or fewer than two cluster counts were tried.
+    """
 
-    dx = -np.diff(ssd)
-    dx2 = -np.diff(dx)
-    dx = np.insert(dx, 0, [0])
-    dx2 = np.insert(dx2, 0, [0, 0])
+    if len(ssd) < 2:
+        return None
+
+    strength = np.zeros_like(ssd)
+    strength[0] = ssd[1] - ssd[0]
+    strength[1:-1] = ssd[:-2] - 3 * ssd[1:-1] + 2 * ssd[2:]
 
-    strength = np.append(np.roll(dx2 - dx, -1)[:-1], [0])
     if not np.any(strength > 0):
-        return 0
+        return None
     if relative:
-        return clusters[np.argmax(strength / clusters)]
-    return clusters[np.argmax(strength)]
+        strength /= k_values
+    return int(np.argmax(strength))
+
+
+def _get_inertias_cached(
+    estimator: KMeans, data: ArrayLike, k_values: Sequence[int], n_jobs: int = -1
+) -> Sequence[Tuple[float, np.ndarray]]:
+    """
+    Get `_get_inertia()` results for each of `k_values`, reusing fits from previous
+    calls on identical data. Data is identified by a hash of its contents along with
+    its shape and dtype, so results are not reused if the data has been modified.
+    Fits which are not cached are run in parallel.
+
+    Args:
+        estimator: Estimator, usually KMeans, to get inertia for.
+        data: Data to fit `estimator` to for getting inertia.
+        k_values: Numbers of clusters to get inertia for.
+        n_jobs: Number of parallel jobs used to fit uncached values of k.
+
+    Returns:
+        Tuple of inertia value and fitted cluster centres for each of `k_values`.
+    """
+
+    values = np.ascontiguousarray(data)
+    digest = hashlib.blake2b(values.tobytes(), digest_size=8).hexdigest()
+    fingerprint = (digest, values.shape, values.dtype.str, repr(estimator))
+    keys = [(*fingerprint, k) for k in k_values]
+
+    results = {key: _inertia_cache[key] for key in keys if key in _inertia_cache}
+    missing = [key for key in keys if key not in results]
+
+    fits = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_get_inertia)(estimator, data, key[-1]) for key in missing
+    )
+    results.update(zip(missing, fits))
 
+    for key in keys:
+        _inertia_cache[key] = results[key]
+        _inertia_cache.move_to_end(key)
+    while len(_inertia_cache) > INERTIA_CACHE_SIZE:
+        _inertia_cache.popitem(last=False)
 
-def _get_inertia(estimator: KMeans, data: ArrayLike, k: int) -> float:
+    return [results[key] for key in keys]
+
+
+def _get_inertia(
+    estimator: KMeans, data: ArrayLike, k: int
+) -> Tuple[float, np.ndarray]:
     """
     Get the intertia value for `estimator` when fitted to `data` with `k` clusters.
     Inertia is also known as within cluster sum of squared distances, meaning the sum
     of squared distances of data points from their nearest cluster centroid. This can
     be used to assess the goodness of fit of a clustering model.
 
+    A fresh clone of `estimator` is fitted, so `estimator` itself is not modified and
+    calls for different `k` can safely run in parallel. If `estimator` is a `KMeans`
+    and `data` has at least `MINI_BATCH_MIN_ROWS` rows, a `MiniBatchKMeans` is fitted
+    instead. Its inertia is an approximation, but the elbow test only depends on the
+    shape of the inertia curve.
+
     Args:
         estimator: Estimator, usually KMeans, to get inertia for.
         data: Data to fit `estimator` to for getting inertia.
         k: Number of clusters to use.
 
     Returns:
-        Inertia value.
+        Tuple of inertia value and fitted cluster centres.
     """
 
-    estimator.n_clusters = k
+    if type(estimator) is KMeans and len(data) >= MINI_BATCH_MIN_ROWS:
+        estimator = MiniBatchKMeans(
+            n_clusters=k,
+            batch_size=1024,
+            n_init=3,
+            max_iter=100,
+            random_state=estimator.random_state,
+        )
+    else:
+        estimator = clone(estimator).set_params(n_clusters=k)
+
     estimator.fit(data)
-    return estimator.inertia_
+    return estimator.inertia_, estimator.cluster_centers_
@@ -1,9 +1,13 @@
-from typing import Any, Dict, Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 
 import pandas as pd
 
 from autoscout.data import scrape
-from autoscout.util import sleep_and_return
+from autoscout.data.fbref import table as table_util
+
+STRING_FEATURES = frozenset(
+    ("player", "nationality", "position", "team", "age", "birth_year")
+)
 
 
 def get_data(
@@ -13,6 +17,7 @@ def get_data(
     team: bool = False,
     vs: bool = False,
     sleep_seconds: float = 5.0,
+    max_workers: int = 4,
 ) -> pd.DataFrame:
     """
     Obtain player or team data for statistics specified in the configuration, from the
@@ -25,23 +30,30 @@ def get_data(
         team: Obtain team-level data if `True`, else player-level data.
         vs: For team-level data, obtain statistics against each team if `True` or for
             each team if `False`.
-        sleep_seconds: Seconds to pause between each request to fbref.
+        sleep_seconds: Minimum seconds between the start of each request to fbref.
+        max_workers: Number of categories which may be downloaded concurrently.
 
     Returns:
         Downloaded and transformed DataFrame.
     """
 
-    df = pd.concat(
-        [
-            sleep_and_return(
-                get_data_for_category(k, top, end, v, team=team, vs=vs), sleep_seconds
-            )
-            for k, v in config.items()
-        ],
-        axis=1,
+    # download every category page up front, then extract each category from the
+    # returned tables rather than fetching its page again
+    pages = scrape.get_all_tables_many(
+        [top + k + end for k in config], sleep_seconds, max_workers
     )
 
-    return df.loc[:, ~df.columns.duplicated()]
+    # drop columns already obtained from an earlier category before concatenating,
+    # rather than concatenating duplicates and dropping them afterwards
+    parts, seen = [], set()
+    for k, v in config.items():
+        tables = pages[top + k + end]
+        part = get_data_for_category(k, top, end, v, team=team, vs=vs, tables=tables)
+        part = part.loc[:, ~(part.columns.duplicated() | part.columns.isin(seen))]
+        seen.update(part.columns)
+        parts.append(part)
+
+    return pd.concat(parts, axis=1, copy=False)
 
 
 def get_data_for_category(
@@ -51,6 +63,7 @@ def get_data_for_category(
     features: Sequence[str],
     team: bool = False,
     vs: bool = False,
+    tables: Sequence = None,
 ) -> pd.DataFrame:
     """
     Obtain player or team data for statistics specified in `features`, from the fbref
@@ -64,13 +77,15 @@ def get_data_for_category(
         team: Obtain team-level data if `True`, else player-level data.
         vs: For team-level data, obtain statistics against each team if `True` or for
             each team if `False`.
+        tables: Tables already downloaded from the category page, such as by
+            `scrape.get_all_tables_many()`. Downloaded if not given.
 
     Returns:
         Downloaded DataFrame for the given statistics in this category.
     """
 
     url = top + category + end
-    player_table, team_table = get_tables(url, vs=vs)
+    player_table, team_table = get_tables(url, vs=vs, tables=tables)
     table = team_table if team else player_table
     return get_data_from_table(features, table, team)
 
@@ -90,63 +105,25 @@ def get_data_from_table(
         Extracted DataFrame from the table.
     """
 
-    pre_df: Dict[str, Sequence[Any]] = dict()
-    rows = table.find_all("tr")
-
-    for row in rows:
-        if row.find("th", {"scope": "row"}) is None:
-            continue
-
-        if team:
-            name = (
-                row.find("th", {"data-stat": "team"})
-                .text.strip()
-                .encode()
-                .decode("utf-8")
-            )
-
-            if "team" in pre_df:
-                pre_df["team"].append(name)
-            else:
-                pre_df["team"] = [name]
-
-        for feat in features:
-            cell = row.find("td", {"data-stat": feat})
-            text = cell.text.strip().encode().decode("utf-8")
-
-            if text == "":
-                text = "0"
-            if feat not in (
-                "player",
-                "nationality",
-                "position",
-                "team",
-                "age",
-                "birth_year",
-            ):
-                text = float(text.replace(",", ""))
-
-            if feat in pre_df:
-                pre_df[feat].append(text)
-            else:
-                pre_df[feat] = [text]
-
-    return pd.DataFrame.from_dict(pre_df)
-
-
-def get_tables(url: str, vs: bool = False) -> Tuple:
+    keys = ["team"] if team else []
+    return table_util.extract_table(table, features, STRING_FEATURES, keys=keys)
+
+
+def get_tables(url: str, vs: bool = False, tables: Sequence = None) -> Tuple:
     """
     Obtain team and player HTML tables from a competition page on the fbref website.
 
     Args:
         url: URL to the page containing the tables.
         vs: If `True`, obtain statistics against the teams table, instead of for.
+        tables: Tables already downloaded from `url`. Downloaded if not given.
 
     Returns:
         Tuple of two tables, player and team, of statistics.
     """
 
-    tables = scrape.get_all_tables(url)
+    if tables is None:
+        tables = scrape.get_all_tables(url)
     team_table, team_vs_table, player_table = tables[:3]
     if vs:
         return player_table, team_vs_table
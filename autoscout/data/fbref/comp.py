@@ -1,8 +1,27 @@
-from typing import Any, Dict, Sequence
+from typing import Dict, Sequence
 
 import pandas as pd
 
 from autoscout.data import scrape
+from autoscout.data.fbref import table as table_util
+
+STRING_FEATURES = frozenset(
+    (
+        "date",
+        "referee",
+        "score",
+        "start_time",
+        "round",
+        "dayofweek",
+        "venue",
+        "result",
+        "match_report",
+        "game_started",
+        "home_team",
+        "away_team",
+        "notes",
+    )
+)
 
 
 def get_competition_data(
@@ -42,48 +61,6 @@ def get_data_from_table(
         Extracted DataFrame from the table.
     """
 
-    pre_df: Dict[str, Sequence[Any]] = dict()
-    rows = table.find_all("tr")
-
-    for row in rows:
-        if row.find("th", {"scope": "row"}) is None:
-            continue
-
-        date = row.find(
-            "td", {"data-stat": "date"}
-        ).text.strip().encode().decode("utf-8")
-
-        if "date" in pre_df:
-            pre_df["date"].append(date)
-        else:
-            pre_df["date"] = [date]
-
-        for feat in features:
-            cell = row.find("td", {"data-stat": feat})
-            text = cell.text.strip().encode().decode("utf-8")
-
-            if text == "":
-                text = "0"
-            if feat not in (
-                "date",
-                "referee",
-                "score",
-                "start_time",
-                "round",
-                "dayofweek",
-                "venue",
-                "result",
-                "match_report",
-                "game_started",
-                "home_team",
-                "away_team",
-                "notes",
-            ):
-                text = float(text.replace(",", ""))
-
-            if feat in pre_df:
-                pre_df[feat].append(text)
-            else:
-                pre_df[feat] = [text]
-
-    return pd.DataFrame.from_dict(pre_df)
+    return table_util.extract_table(
+        table, features, STRING_FEATURES, keys=["date"], dates=["date"]
+    )
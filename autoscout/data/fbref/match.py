@@ -1,9 +1,26 @@
-from typing import Any, Dict, Sequence
+from typing import Dict, Sequence, Tuple
 
 import pandas as pd
 
 from autoscout.data import scrape
-from autoscout.util import sleep_and_return
+from autoscout.data.fbref import table as table_util
+
+STRING_FEATURES = frozenset(
+    (
+        "opponent",
+        "date",
+        "start_time",
+        "comp",
+        "round",
+        "dayofweek",
+        "venue",
+        "result",
+        "match_report",
+        "game_started",
+        "position",
+        "squad",
+    )
+)
 
 
 def get_data(
@@ -14,6 +31,7 @@ def get_data(
     team: bool = False,
     vs: bool = False,
     sleep_seconds: float = 7.0,
+    max_workers: int = 4,
 ) -> pd.DataFrame:
     """
     Obtain player or team match-level data for statistics specified in the `config`,
@@ -26,23 +44,86 @@ def get_data(
         team: Obtain team-level data if `True`, else player-level data.
         vs: For team-level data, obtain statistics against each team if `True` or for
             each team if `False`.
-        sleep_seconds: Seconds to pause between each request to fbref.
+        sleep_seconds: Minimum seconds between the start of each request to fbref.
+        max_workers: Number of categories which may be downloaded concurrently.
 
     Returns:
         Downloaded and transformed DataFrame.
     """
 
-    df = pd.concat(
-        [
-            sleep_and_return(
-                get_data_for_category(k, top, end, v, team=team, vs=vs), sleep_seconds
-            )
-            for k, v in config.items()
-        ],
-        axis=1,
+    # download every category page up front, then extract each category from the
+    # returned tables rather than fetching its page again
+    pages = scrape.get_all_tables_many(
+        [top + k + end for k in config], sleep_seconds, max_workers
+    )
+
+    return _combine_categories(config, top, end, name, pages, team=team, vs=vs)
+
+
+def get_data_many(
+    config: Dict[str, Sequence[str]],
+    sources: Sequence[Tuple[str, str, str]],
+    team: bool = False,
+    vs: bool = False,
+    sleep_seconds: float = 7.0,
+    max_workers: int = 4,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Obtain player or team match-level data for several players or teams, as
+    `get_data()` does for one. Pages for every player or team are downloaded in a
+    single concurrent batch, sharing one rate limit.
+
+    Args:
+        config: Dict defining statistics per-category from fbref.
+        sources: Tuples of (top, end, name) for each player or team, where top and end
+            are the start and final sections of their fbref URL.
+        team: Obtain team-level data if `True`, else player-level data.
+        vs: For team-level data, obtain statistics against each team if `True` or for
+            each team if `False`.
+        sleep_seconds: Minimum seconds between the start of each request to fbref.
+        max_workers: Number of pages which may be downloaded concurrently.
+
+    Returns:
+        Dict mapping each name to its downloaded and transformed DataFrame.
+    """
+
+    pages = scrape.get_all_tables_many(
+        [top + k + end for top, end, _ in sources for k in config],
+        sleep_seconds,
+        max_workers,
     )
 
-    return df.loc[:, ~df.columns.duplicated()].assign(name=name)
+    return {
+        name: _combine_categories(config, top, end, name, pages, team=team, vs=vs)
+        for top, end, name in sources
+    }
+
+
+def _combine_categories(
+    config: Dict[str, Sequence[str]],
+    top: str,
+    end: str,
+    name: str,
+    pages: Dict[str, Sequence],
+    team: bool = False,
+    vs: bool = False,
+) -> pd.DataFrame:
+    """
+    Extract and combine every category in `config` for one player or team, from the
+    tables of already downloaded `pages`, keyed by URL.
+    """
+
+    # drop columns already obtained from an earlier category before concatenating,
+    # rather than concatenating duplicates and dropping them afterwards
+    parts, seen = [], set()
+    for k, v in config.items():
+        tables = pages[top + k + end]
+        part = get_data_for_category(k, top, end, v, team=team, vs=vs, tables=tables)
+        part = part.loc[:, ~(part.columns.duplicated() | part.columns.isin(seen))]
+        seen.update(part.columns)
+        parts.append(part)
+
+    return pd.concat(parts, axis=1, copy=False).assign(name=name)
 
 
 def get_data_for_category(
@@ -52,6 +133,7 @@ def get_data_for_category(
     features: Sequence[str],
     team: bool = False,
     vs: bool = False,
+    tables: Sequence = None,
 ) -> pd.DataFrame:
     """
     Obtain all competition player or team data for statistics specified in `features`, from the fbref
@@ -65,13 +147,15 @@ def get_data_for_category(
         team: Obtain team-level data if `True`, else player-level data.
         vs: For team-level data, obtain statistics against each team if `True` or for
             each team if `False`.
+        tables: Tables already downloaded from the category page, such as by
+            `scrape.get_all_tables_many()`. Downloaded if not given.
 
     Returns:
         Downloaded DataFrame for the given statistics in this category.
     """
 
-    url = top + category + end
-    tables = scrape.get_all_tables(url)
+    if tables is None:
+        tables = scrape.get_all_tables(top + category + end)
     table = tables[1] if (team and vs and category != "schedule") else tables[0]
     return get_data_from_table(features, table)
 
@@ -90,53 +174,11 @@ def get_data_from_table(
         Extracted DataFrame from the table.
     """
 
-    pre_df: Dict[str, Sequence[Any]] = dict()
-    rows = table.find_all("tr")
-
-    for row in rows:
-        if row.find("th", {"scope": "row"}) is None:
-            continue
-
-        goals_cell = row.find("td", {"data-stat": "goals_for"})
-        if goals_cell is not None and goals_cell.text.strip().encode().decode("utf-8") == "":
-            continue
-
-        opponent, date = (
-            row.find(y, {"data-stat": x}).text.strip().encode().decode("utf-8")
-            for (x, y) in {"opponent": "td", "date": "th"}.items()
-        )
-
-        if "opponent" in pre_df:
-            pre_df["opponent"].append(opponent)
-            pre_df["date"].append(date)
-        else:
-            pre_df["opponent"] = [opponent]
-            pre_df["date"] = [date]
-
-        for feat in features:
-            cell = row.find("td", {"data-stat": feat})
-            text = cell.text.strip().encode().decode("utf-8")
-
-            if text == "":
-                text = "0"
-            if feat not in (
-                "date",
-                "start_time",
-                "comp",
-                "round",
-                "dayofweek",
-                "venue",
-                "result",
-                "opponent",
-                "match_report",
-                "game_started",
-                "position",
-            ):
-                text = float(text.replace(",", ""))
-
-            if feat in pre_df:
-                pre_df[feat].append(text)
-            else:
-                pre_df[feat] = [text]
-
-    return pd.DataFrame.from_dict(pre_df)
+    return table_util.extract_table(
+        table,
+        features,
+        STRING_FEATURES,
+        keys=["opponent", "date"],
+        dates=["date"],
+        skip_empty="goals_for",
+    )
@@ -0,0 +1,69 @@
+from typing import AbstractSet, List, Optional, Sequence
+
+import pandas as pd
+from lxml import etree
+
+from autoscout import util
+
+ROW_XPATH = etree.XPath(".//tr[th[@scope='row']]")
+CELLS_XPATH = etree.XPath("./*[@data-stat]")
+
+COMMA_STRIP = str.maketrans("", "", ",")
+
+
+def extract_table(
+    table,
+    features: Sequence[str],
+    string_features: AbstractSet[str],
+    keys: Sequence[str] = (),
+    dates: Sequence[str] = (),
+    skip_empty: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Extract data from a single HTML table on the fbref website. Statistics are read
+    from the `data-stat` attribute of each cell in rows which have a row header.
+
+    Args:
+        table: HTML table.
+        features: IDs of statistics to extract. Empty cells are read as zero.
+        string_features: IDs of statistics which are text, rather than numeric.
+        keys: IDs of statistics identifying each row, such as team or date, which are
+            placed before `features` and left empty when missing.
+        dates: IDs of statistics to parse as dates.
+        skip_empty: ID of a statistic for which rows are skipped if its cell is
+            present but empty, such as goals in unplayed fixtures.
+
+    Returns:
+        Extracted DataFrame from the table.
+    """
+
+    columns = [*keys, *features]
+    records: List[List[str]] = []
+
+    for row in ROW_XPATH(table):
+        # read every cell of the row in one pass, rather than one lookup per feature
+        cells = {
+            cell.get("data-stat"): cell.text_content() for cell in CELLS_XPATH(row)
+        }
+
+        if skip_empty is not None:
+            value = cells.get(skip_empty)
+            if value is not None and value.strip() == "":
+                continue
+
+        record = [cells.get(key, "").strip() for key in keys]
+        record.extend(cells.get(feat, "").strip() or "0" for feat in features)
+        records.append(record)
+
+    df = pd.DataFrame(records, columns=columns)
+
+    # convert all numeric columns at once rather than casting cell by cell
+    text = {*string_features, *keys, *dates}
+    numeric = [col for col in df.columns if col not in text]
+    df[numeric] = (
+        df[numeric].apply(lambda col: col.str.translate(COMMA_STRIP)).astype(float)
+    )
+    for col in dates:
+        df[col] = pd.to_datetime(df[col], errors="coerce")
+
+    return util.to_categorical(df, text.difference(dates))
@@ -2,16 +2,69 @@
 General purpose utilities for web data scraping.
 """
 
-import re
-from typing import Sequence
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
+from requests import Request
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedResponse, CachedSession
+from urllib3.util.retry import Retry
+
+from autoscout.util import rate_limited
+
+TBODY_XPATH = etree.XPath("//tbody")
+
+# each parsed table keeps the whole tree of its page alive, several MB per fbref page,
+# so only the tables of the most recent pages are kept in memory
+TABLES_CACHE_SIZE = 8
+_TABLES_CACHE: "OrderedDict[str, Tuple]" = OrderedDict()
+_TABLES_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> CachedSession:
+    """
+    Get the session shared by all requests, creating it on first use. Connections are
+    pooled across pages, and responses are cached for six hours in the user cache
+    directory (such as `~/.cache/fbref.sqlite`), so repeat runs do not need to
+    download them again.
+
+    Returns:
+        Shared cached session.
+    """
+
+    session = CachedSession(
+        cache_name="fbref",
+        backend="sqlite",
+        use_cache_dir=True,
+        expire_after=timedelta(hours=6),
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            # rate limiting and transient server errors are retried with exponential
+            # backoff, waiting for any Retry-After header fbref sends with a 429
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        ),
+    )
+    return session
 
 
 def get_all_tables(url: str) -> Sequence:
     """
-    Obtain all HTML tables from a URL.
+    Obtain all HTML tables from a URL. Parsed tables of the last `TABLES_CACHE_SIZE`
+    pages are cached per URL, so must not be modified by callers.
 
     Args:
         url: URL to the page containing the tables.
@@ -20,9 +73,103 @@ def get_all_tables(url: str) -> Sequence:
         Sequence of found tables.
     """
 
-    res = requests.get(url)
-    # avoid issue with comments breaking parsing
-    comm = re.compile("<!--|-->")
-    soup = BeautifulSoup(comm.sub("", res.text), "lxml")
-    tables = soup.findAll("tbody")
+    return _get_tables(url, _download)
+
+
+def _get_tables(url: str, download: Callable) -> Sequence:
+    """
+    Implementation of `get_all_tables()`, fetching pages missing from the parsed-table
+    cache with `download`.
+    """
+
+    with _TABLES_LOCK:
+        if url in _TABLES_CACHE:
+            _TABLES_CACHE.move_to_end(url)
+            return _TABLES_CACHE[url]
+
+    res = download(url)
+    # fbref serves most tables inside HTML comments, so the markers are stripped
+    # rather than the comments being removed. Plain replaces of the two fixed
+    # markers are faster than a regex substitution over the whole page. The raw
+    # bytes are parsed directly to avoid decoding the page to str first
+    content = res.content.replace(b"<!--", b"").replace(b"-->", b"")
+    parser = html.HTMLParser(encoding=res.encoding or "utf-8")
+    tree = html.fromstring(content, parser=parser)
+    tables = tuple(TBODY_XPATH(tree))
+
+    with _TABLES_LOCK:
+        _TABLES_CACHE[url] = tables
+        while len(_TABLES_CACHE) > TABLES_CACHE_SIZE:
+            _TABLES_CACHE.popitem(last=False)
+
     return tables
+
+
+def get_all_tables_many(
+    urls: Iterable[str], sleep_seconds: float = 5.0, max_workers: int = 4
+) -> Dict[str, Sequence]:
+    """
+    Obtain all HTML tables from several URLs, downloading the pages concurrently while
+    starting at most one request every `sleep_seconds` across the whole process. Each
+    distinct URL is only downloaded once, and pages which are already cached are
+    returned without waiting.
+
+    Args:
+        urls: URLs to the pages containing the tables.
+        sleep_seconds: Minimum seconds between the start of each network request.
+        max_workers: Number of pages which may be downloaded concurrently.
+
+    Returns:
+        Dict mapping each URL to the sequence of tables found on that page.
+    """
+
+    unique_urls = list(dict.fromkeys(urls))
+    limited_download = _shared_rate_limiter(sleep_seconds)
+
+    def download(url: str):
+        # only requests which reach fbref are rate limited, so pages held in either
+        # the parsed-table cache or the response cache are returned without waiting.
+        # A fresh cached response is used as is, rather than read again by the session
+        cached = _cached_response(url)
+        if cached is not None:
+            return cached
+        return limited_download(url)
+
+    def get_tables(url: str) -> Sequence:
+        return _get_tables(url, download)
+
+    get_session()  # create the shared session before any worker thread needs it
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(unique_urls, executor.map(get_tables, unique_urls)))
+
+
+def _download(url: str):
+    """
+    Get the response for `url`, from the response cache if it holds a fresh copy.
+    """
+
+    return get_session().get(url)
+
+
+def _cached_response(url: str) -> Optional[CachedResponse]:
+    """
+    Get the response for `url` from the response cache, if it holds a fresh copy, so
+    that no request needs to be sent. Returns `None` otherwise.
+    """
+
+    cache = get_session().cache
+    response = cache.get_response(cache.create_key(Request("GET", url)))
+    if response is None or response.is_expired:
+        return None
+    return response
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_rate_limiter(sleep_seconds: float) -> Callable:
+    """
+    Rate limited `_download()`, shared by every batch in the process using the same
+    `sleep_seconds`, so that consecutive or concurrent batches cannot exceed the
+    request rate between them.
+    """
+
+    return rate_limited(_download, sleep_seconds)
@@ -2,7 +2,6 @@
 Load and preprocess player and team data from tabular (CSV) format.
 """
 
-import itertools
 from typing import Callable, Dict, Sequence, Union
 
 import numpy as np
@@ -26,9 +25,9 @@ def combine_data(
         Combined data.
     """
 
-    data = pd.concat(data, axis=0, join="outer" if retain_nans else "inner")
-    data = data.reset_index(drop=True)
-    return data
+    return pd.concat(
+        data, axis=0, join="outer" if retain_nans else "inner", ignore_index=True
+    )
 
 
 def rolling(
@@ -38,6 +37,7 @@ def rolling(
     min_periods: int = 5,
     reduction: str = "mean",
     dropna: bool = True,
+    dtype: type = np.float32,
 ) -> pd.DataFrame:
     """
     Include a rolling column derived from those in `columns`. Names of rolling columns
@@ -51,24 +51,27 @@ def rolling(
             values. Only recommended if `reduction` is `"mean"`.
         reduction: How to reduce rolling values. Supports "mean" and "sum".
         dropna: Drop rows containing NaN values in the new roll columns.
+        dtype: Float type of the output columns. Single precision halves the memory
+            used, which is ample for football statistics.
 
     Returns:
         Copy of `data` with additional rolling columns.
     """
 
-    data = data.copy(deep=True)
+    data = data.copy(deep=False)
+    columns = list(columns)
 
     columns_roll = [f"{col}_roll_{reduction}" for col in columns]
 
-    for col, col_roll in zip(columns, columns_roll):
-        roll = data[col].rolling(roll_length, min_periods=min_periods)
+    # roll and backfill all columns as one block, rather than one column at a time
+    roll = data[columns].rolling(roll_length, min_periods=min_periods)
 
-        if reduction == "sum":
-            roll = roll.sum()
-        else:
-            roll = roll.mean()
+    if reduction == "sum":
+        roll = roll.sum()
+    else:
+        roll = roll.mean()
 
-        data[col_roll] = roll.fillna(method="bfill")
+    data[columns_roll] = roll.fillna(method="bfill").to_numpy(dtype=dtype)
 
     if dropna:
         data = data.dropna(subset=columns_roll).reset_index()
@@ -80,6 +83,7 @@ def clamp_by_percentiles(
     data: pd.DataFrame,
     columns: Sequence[str],
     alpha: float = 0.05,
+    dtype: type = np.float32,
 ) -> pd.DataFrame:
     """
     Clamp values in `columns` within `data` to within percentiles `alpha` and
@@ -89,17 +93,20 @@ def clamp_by_percentiles(
         data: DataFrame to clamp values within.
         columns: Columns to apply clamping to.
         alpha: Percentile to clamp at.
+        dtype: Float type of the output columns. Single precision halves the memory
+            used, which is ample for football statistics.
 
     Returns:
         DataFrame with selected columns clamped.
     """
 
-    data = data.copy(deep=True)
-
-    for column in columns:
-        vals = data[column]
+    data = data.copy(deep=False)
+    columns = list(columns)
 
-        data[column] = vals.clip(vals.quantile(alpha), vals.quantile(1 - alpha))
+    # find both bounds for every column in one call, then clip the whole block
+    values = data[columns].to_numpy(dtype=dtype)
+    lower, upper = np.nanquantile(values, (alpha, 1 - alpha), axis=0)
+    data[columns] = np.clip(values, lower, upper)
 
     return data
 
@@ -107,6 +114,7 @@ def clamp_by_percentiles(
 def adjust_per_90(
     data: pd.DataFrame,
     columns: Sequence[str],
+    dtype: type = np.float32,
 ) -> pd.DataFrame:
     """
     Adjust selected columns from the given DataFrame to be per 90 minutes played.
@@ -114,13 +122,23 @@ def adjust_per_90(
     Args:
         data: DataFrame to adjust from.
         columns: Columns to apply adjustment to.
+        dtype: Float type of the output columns. Single precision halves the memory
+            used, which is ample for football statistics.
 
     Returns:
         Adjusted DataFrame.
     """
 
-    data = data.copy(deep=True)
-    data[columns] = data[columns].div(data.minutes, axis=0).mul(90, axis=0)
+    data = data.copy(deep=False)
+    columns = list(columns)
+
+    minutes = data["minutes"].to_numpy(dtype=dtype)
+
+    # scale each row by one factor, so the block is traversed once. Zero minutes give
+    # inf or NaN, as pandas division does, without warnings
+    with np.errstate(divide="ignore", invalid="ignore"):
+        data[columns] = data[columns].to_numpy(dtype=dtype) * (90 / minutes)[:, None]
+
     return data
 
 
@@ -143,8 +161,7 @@ def adjust_possession_def(
     """
 
     p_delta = possessions - 50
-    exp = np.expand_dims(np.power(np.e, -0.1 * p_delta), 1)
-    adjusted = targets * (2 / (1 + exp))
+    adjusted = targets * (2 / (1 + np.exp(-0.1 * p_delta)))[:, None]
     return adjusted
 
 
@@ -153,6 +170,7 @@ def adjust_possession(
     data_team: pd.DataFrame,
     columns: Sequence[str],
     adjust_fn: Callable[[np.ndarray, np.ndarray], np.ndarray] = adjust_possession_def,
+    dtype: type = np.float32,
 ) -> pd.DataFrame:
     """
     Adjust selected columns from the given DataFrame for the level of possession
@@ -164,7 +182,8 @@ def adjust_possession(
     will match a game in `data_player` to a game in `data_time` via two checks. First,
     `date` column being equal. Second, `squad` in `data_player` being equal to `name`
     in `data_team`. So `date` must be present in both DataFrames, `squad` must be in
-    `data_player`, and `name` must be in `data_team` for this function to work.
+    `data_player`, and `name` must be in `data_team` for this function to work. Player
+    matches with no corresponding team match are given NaN adjusted values.
 
     Args:
         data_player: DataFrame of player data where rows are matches played by the
@@ -172,21 +191,31 @@ def adjust_possession(
         data_team: DataFrame of team data where rows are matches played by the team.
         columns: Columns to apply adjustments to.
         adjust_fn: Define the exact transformation to use as a possession adjustment.
+        dtype: Float type of the output columns. Single precision halves the memory
+            used, which is ample for football statistics.
 
     Returns:
         Adjusted DataFrame.
     """
 
-    data_player = data_player.copy(deep=True)
+    data_player = data_player.copy(deep=False)
+    columns = list(columns)
 
-    team_possessions = data_player.apply(
-        lambda row: _get_team_possession(row, data_team), axis=1
-    )
+    # look up every team possession value in one join, rather than filtering
+    # `data_team` once per player match
+    team_possessions = data_player[["date", "squad"]].merge(
+        data_team[["date", "name", "possession"]],
+        how="left",
+        left_on=["date", "squad"],
+        right_on=["date", "name"],
+        validate="m:1",
+    )["possession"]
 
     padj_columns = [f"padj_{col}" for col in columns]
 
     data_player[padj_columns] = adjust_fn(
-        data_player[columns].to_numpy(), team_possessions.to_numpy()
+        data_player[columns].to_numpy(dtype=dtype),
+        team_possessions.to_numpy(dtype=dtype),
     )
 
     return data_player
@@ -206,20 +235,17 @@ def filter_categories(
         stats_config: Config defining categories and their associated statistics.
         categories: Categories to filter.
         retain: If `True`, keep statistics included in given categories. If `False`,
-            drop statistics included in given categories.
+            drop statistics included in given categories, ignoring any which are not
+            present in `data`.
 
     Returns:
         New DataFrame with filtering criteria applied.
     """
 
-    stats = list(
-        itertools.chain([v for k, v in stats_config.items() if k in categories])
-    )
-
-    return data[stats] if retain else data.drop(stats, axis=1)
+    if isinstance(categories, str):
+        categories = [categories]
+    categories = frozenset(categories)
 
+    stats = [stat for k, v in stats_config.items() if k in categories for stat in v]
 
-def _get_team_possession(player_match: pd.Series, team_data: pd.DataFrame) -> float:
-    team_filtered = team_data[team_data["date"] == player_match["date"]]
-    team_filtered = team_filtered[team_filtered["name"] == player_match["squad"]]
-    return float(team_filtered["possession"])
+    return data[stats] if retain else data.drop(stats, axis=1, errors="ignore")
@@ -1,8 +1,7 @@
 from typing import Dict, Sequence, Union
 
+import numpy as np
 import pandas as pd
-from scipy.spatial import distance
-from sklearn.preprocessing import MinMaxScaler
 
 from autoscout.util import get_record
 
@@ -30,14 +29,17 @@ def search(data: pd.DataFrame, criteria: Dict[str, Dict[str, float]]) -> pd.Data
             names to comparison values.
     """
 
+    # combine every criterion into one mask, so the rows are only selected once
+    mask = np.ones(len(data.index), dtype=bool)
+
     for stat, value in criteria.get("gte", dict()).items():
-        data = data[data[stat] >= value]
+        mask &= (data[stat] >= value).to_numpy()
     for stat, value in criteria.get("eq", dict()).items():
-        data = data[data[stat] == value]
+        mask &= (data[stat] == value).to_numpy()
     for stat, value in criteria.get("lte", dict()).items():
-        data = data[data[stat] <= value]
+        mask &= (data[stat] <= value).to_numpy()
 
-    return data
+    return data[mask]
 
 
 def search_similar(
@@ -65,17 +67,21 @@ def search_similar(
         acquired by `index`.
     """
 
-    data = data.copy(deep=True)
-    scaler = MinMaxScaler()
+    # a Series for an int index or a single-row DataFrame otherwise, either way one row
+    baseline = get_record(data, index)[columns].to_numpy(dtype=float).reshape(1, -1)
+    values = data[columns].to_numpy(dtype=float)
 
-    baseline = get_record(data, index)[columns]
-    data_relevant = data[columns]
+    # min-max scaling only changes distances by each column's range, so differences
+    # are divided by the range rather than scaling every value first
+    span = np.nanmax(values, axis=0) - np.nanmin(values, axis=0)
+    span[span == 0] = 1
 
-    data_relevant = pd.DataFrame(scaler.fit_transform(data_relevant), columns=columns)
-    baseline = pd.DataFrame(scaler.transform(baseline), columns=columns).squeeze()
+    # all distances in one vectorised pass, then only the `num` nearest are sorted
+    distances = np.linalg.norm((values - baseline) / span, axis=1)
+    if num < len(distances):
+        nearest = np.argpartition(distances, num)[:num]
+    else:
+        nearest = np.arange(len(distances))
+    nearest = nearest[np.lexsort((nearest, distances[nearest]))]
 
-    return data.iloc[
-        data_relevant.apply(lambda col: distance.euclidean(baseline, col), axis=1)
-        .nsmallest(num)
-        .index.to_list()
-    ]
+    return data.iloc[nearest]
@@ -1,11 +1,21 @@
+import functools
 import json
+import threading
 from pathlib import Path
 from time import sleep
-from typing import Any, Dict, Sequence, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Sequence, Union
 
+import numpy as np
 import pandas as pd
-import polars as pl
-from sklearn.preprocessing import minmax_scale
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# orjson parses JSON several times faster than the standard library, when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 def get_record(data: pd.DataFrame, index: Union[str, int]) -> pd.DataFrame:
@@ -30,16 +40,20 @@ def get_record(data: pd.DataFrame, index: Union[str, int]) -> pd.DataFrame:
         return data.iloc[index]
 
     player = "player" in data.columns
-    data = data[data["player" if player else "team"] == index]
+    # positions of matching rows, so only those rows are ever copied out of `data`
+    locs = np.flatnonzero(data["player" if player else "team"].to_numpy() == index)
 
-    if len(data.index) > 1:
-        return data.iloc[data["minutes"].argmax()]
+    if len(locs) > 1:
+        return data.iloc[locs[data["minutes"].iloc[locs].argmax()]]
 
-    return data
+    return data.iloc[locs]
 
 
 def min_max_scale(
-    data: pd.DataFrame, columns: Sequence[str], inplace: bool = False
+    data: pd.DataFrame,
+    columns: Sequence[str],
+    inplace: bool = False,
+    dtype: type = np.float32,
 ) -> pd.DataFrame:
     """
     Scale selected `columns` in `data` to [0, 1].
@@ -48,17 +62,55 @@ def min_max_scale(
         data: Original data to scale.
         columns: Columns to perform scaling on.
         inplace: Modify existing DataFrame. Not recommended.
+        dtype: Float type of the output columns. Single precision halves the memory
+            used, which is ample for values in [0, 1].
 
     Returns:
         DataFrame with selected columns scaled.
     """
 
     if not inplace:
-        data = data.copy(deep=True)
-    data[columns] = minmax_scale(data[columns])
+        data = data.copy(deep=False)
+    columns = list(columns)
+
+    values = data[columns].to_numpy(dtype=dtype)
+
+    # as in sklearn's minmax_scale, NaNs are ignored and constant columns become zero
+    low = np.nanmin(values, axis=0)
+    span = np.nanmax(values, axis=0) - low
+    span[span == 0] = 1
+    data[columns] = (values - low) / span
+
     return data
 
 
+def to_categorical(
+    data: pd.DataFrame, columns: Sequence[str], max_unique_ratio: float = 0.5
+) -> pd.DataFrame:
+    """
+    Convert low-cardinality string `columns` in `data` to categorical dtype, which
+    stores each distinct value once. Columns with many distinct values relative to the
+    number of rows, such as player names, are left as they are.
+
+    Args:
+        data: Original data to convert.
+        columns: Columns to consider for conversion. Missing columns are ignored.
+        max_unique_ratio: Largest ratio of distinct values to rows for which a column
+            is converted.
+
+    Returns:
+        DataFrame with selected columns converted.
+    """
+
+    limit = max_unique_ratio * len(data.index)
+    dtypes = {
+        col: "category"
+        for col in columns
+        if col in data.columns and data[col].nunique() <= limit
+    }
+    return data.astype(dtypes)
+
+
 def sleep_and_return(result: Any, sleep_seconds: float) -> Any:
     """
     Sleep (do nothing) for `sleep_seconds`, then return `result`.
@@ -68,6 +120,39 @@ def sleep_and_return(result: Any, sleep_seconds: float) -> Any:
     return result
 
 
+def rate_limited(
+    func: Callable, period_seconds: float, calls_per_period: int = 1
+) -> Callable:
+    """
+    Wrap `func` so that at most `calls_per_period` calls may begin within any window
+    of `period_seconds`, across all threads sharing the wrapper.
+
+    Unlike `sleep_and_return()`, the wait is counted from the start of each call, so
+    time spent inside `func` (such as waiting on a HTTP response) counts towards the
+    window rather than being added on top of it.
+
+    Args:
+        func: Function to rate limit.
+        period_seconds: Length of the rate limiting window.
+        calls_per_period: Number of calls allowed to begin within each window.
+
+    Returns:
+        Rate limited version of `func`.
+    """
+
+    semaphore = threading.BoundedSemaphore(calls_per_period)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        semaphore.acquire()
+        timer = threading.Timer(period_seconds, semaphore.release)
+        timer.daemon = True
+        timer.start()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 def load_json(
     file_path: Union[str, Path],
 ) -> Dict[str, Any]:
@@ -75,28 +160,89 @@ def load_json(
     Load `file_path` from JSON to dict.
     """
 
-    file_path = Path(file_path)
-
-    with open(file_path, "r") as f:
-        loaded_json = json.load(f)
+    with open(file_path, "rb") as f:
+        loaded_json = _json_loads(f.read())
 
     return loaded_json
 
 
 def load_csv(
-    file_path: Union[str, Path], format: str = "pandas", **kwargs
-) -> Union[pd.DataFrame, pl.DataFrame]:
+    file_path: Union[str, Path], format: str = "pandas", lazy: bool = False, **kwargs
+) -> Union[pd.DataFrame, "pl.DataFrame", "pl.LazyFrame"]:
     """
     Load `file_path` from CSV to DataFrame.
 
     Args:
         file_path: Path to CSV file.
         format: Format to load CSV as. Options: "pandas" (default), "polars".
+        lazy: With "polars" format, return a LazyFrame scanning the CSV, so that later
+            column selections and filters are applied while reading.
+        **kwargs: Passed to the CSV reader. With "pandas" format, `engine="pyarrow"`
+            parses large files faster across several threads, but reads ISO date
+            columns as dates rather than strings.
+    """
+
+    file_path = Path(file_path)
+
+    if format == "polars":
+        # polars is only imported when asked for, as it is slow to import
+        import polars as pl
+
+        load_function = pl.scan_csv if lazy else pl.read_csv
+        return load_function(file_path, **kwargs)
+
+    return pd.read_csv(file_path, **kwargs)
+
+
+def load_table(
+    file_path: Union[str, Path], format: str = "pandas", **kwargs
+) -> Union[pd.DataFrame, "pl.DataFrame"]:
+    """
+    Load `file_path` to DataFrame, reading Parquet files by their ".parquet" suffix and
+    any other file as CSV.
+
+    Args:
+        file_path: Path to Parquet or CSV file.
+        format: Format to load table as. Options: "pandas" (default), "polars".
     """
 
     file_path = Path(file_path)
-    load_function = pl.read_csv if format == "polars" else pd.read_csv
-    return load_function(file_path, **kwargs)
+
+    if file_path.suffix != ".parquet":
+        return load_csv(file_path, format=format, **kwargs)
+
+    if format == "polars":
+        import polars as pl
+
+        return pl.read_parquet(file_path, **kwargs)
+
+    return pd.read_parquet(file_path, **kwargs)
+
+
+def write_table(
+    df: pd.DataFrame,
+    out_dir: Union[str, Path],
+    basename: str,
+    file_type: str = "parquet",
+    **kwargs,
+) -> Path:
+    """
+    Write `df` to a file named `basename` in directory `out_dir`, with the suffix given
+    by `file_type`.
+
+    Args:
+        df: DataFrame to write.
+        out_dir: Directory to write in.
+        basename: Stem for the file name to write to.
+        file_type: File type to write. Options: "parquet" (default), "csv".
+        **kwargs: Passed to `write_parquet()` or `write_csv()`.
+
+    Returns:
+        Path to the written file.
+    """
+
+    write_function = write_csv if file_type == "csv" else write_parquet
+    return write_function(df, out_dir, basename, **kwargs)
 
 
 def write_csv(
@@ -123,3 +269,31 @@ def write_csv(
     out_path = out_dir / f"{basename}.csv"
     df.to_csv(out_path, **kwargs)
     return out_path
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    out_dir: Union[str, Path],
+    basename: str,
+    **kwargs,
+) -> Path:
+    """
+    Write `df` to a file named `basename`.parquet in directory `out_dir`. Parquet is
+    much faster to write and read than CSV and keeps column dtypes.
+
+    Args:
+        df: DataFrame to write.
+        out_dir: Directory to write in.
+        basename: Stem for the file name to write to.
+        **kwargs: Passed to `DataFrame.to_parquet()`. Compression defaults to zstd.
+
+    Returns:
+        Path to the written Parquet file.
+    """
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f"{basename}.parquet"
+    kwargs.setdefault("compression", "zstd")
+    df.to_parquet(out_path, **kwargs)
+    return out_path
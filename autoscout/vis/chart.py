@@ -1,4 +1,4 @@
-from typing import Sequence, Tuple, Union
+from typing import Iterable, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -8,6 +8,24 @@ from bokeh.plotting.figure import Figure
 from bokeh.transform import factor_cmap
 
 
+def _column_source(data: pd.DataFrame, columns: Iterable[str]) -> ColumnDataSource:
+    """
+    Build a ColumnDataSource holding only `columns` of `data`, so that the plot does
+    not serialise every other column of a wide DataFrame to the browser.
+
+    Args:
+        data: DataFrame containing all input data.
+        columns: Column names referenced by the plot. Duplicates are ignored.
+
+    Returns:
+        ColumnDataSource of the selected columns.
+    """
+
+    return ColumnDataSource(
+        {col: data[col].to_numpy() for col in dict.fromkeys(columns)}
+    )
+
+
 def lines(
     data: pd.DataFrame,
     x_columns: Sequence[str],
@@ -47,16 +65,23 @@ def lines(
 
     plot: Figure = figure(**kwargs)
 
-    source = ColumnDataSource(data)
+    source = _column_source(data, [*x_columns, *y_columns])
 
     for x, y, col, leg in zip(x_columns, y_columns, colors, legend_labels):
         plot.line(x, y, color=col, source=source, legend_label=leg)
 
         if trends:
-            regr = np.polyfit(data[x], data[y], deg=1, full=True)
-            slope, intercept = regr[0][:2]
-            trend = [intercept + slope * v for v in data[x]]
-            plot.line(data[x], trend, color=col, line_dash="dashed")
+            x_values = data[x].to_numpy(dtype=float)
+            y_values = data[y].to_numpy(dtype=float)
+
+            # least squares line in closed form, rather than a general polynomial fit
+            x_mean, y_mean = x_values.mean(), y_values.mean()
+            x_centred = x_values - x_mean
+            slope = x_centred @ (y_values - y_mean) / (x_centred @ x_centred)
+            intercept = y_mean - slope * x_mean
+
+            trend = intercept + slope * x_values
+            plot.line(x_values, trend, color=col, line_dash="dashed")
 
     if isinstance(vshade, int):
         plot.varea(x=x_columns[vshade], y1=y_columns[vshade], y2=0, color=colors[vshade], source=source)
@@ -65,28 +90,25 @@ def lines(
         vs1_y, vs2_y = [y_columns[v] for v in vshade]
         vs1_x = x_columns[vshade[0]]
 
-        compare = data[vs1_y] > data[vs2_y]
+        # read each column once, so every segment below is a cheap array slice
+        x_col = data[vs1_x].to_numpy()
+        y1_col, y2_col = data[vs1_y].to_numpy(), data[vs2_y].to_numpy()
 
-        diff = compare.diff().fillna(0).abs()
-        change_indices = [0,] + [idx for idx, d in enumerate(diff) if d]
+        compare = y1_col > y2_col
 
-        for i, change_idx in enumerate(change_indices):
-            x_start = data[vs1_x][change_idx]
+        # positions where the line on top changes, found in one pass over the data
+        change_indices = [0, *(np.flatnonzero(np.diff(compare)) + 1).tolist()]
 
+        for i, change_idx in enumerate(change_indices):
             end_idx = (
-                change_indices[i + 1]
-                if i + 1 < len(change_indices)
-                else len(data[vs1_x]) - 1
+                change_indices[i + 1] if i + 1 < len(change_indices) else len(x_col)
             )
 
-            x_end = data[vs1_x][end_idx - 1]
-            x_values = np.linspace(x_start, x_end, end_idx - change_idx)
-
             use_2 = compare[change_idx]
             plot.varea(
-                x=x_values,
-                y1=data[vs2_y if use_2 else vs1_y][change_idx:end_idx],
-                y2=data[vs1_y if use_2 else vs2_y][change_idx:end_idx],
+                x=x_col[change_idx:end_idx],
+                y1=(y2_col if use_2 else y1_col)[change_idx:end_idx],
+                y2=(y1_col if use_2 else y2_col)[change_idx:end_idx],
                 hatch_color=colors[vshade[0] if use_2 else vshade[1]],
                 hatch_alpha=0.2, fill_alpha=0.0, hatch_pattern="/",
             )
@@ -123,9 +145,11 @@ def scatter(
         Bokeh Figure used for chart.
     """
 
-    x_range = (data[x].min(), data[x].max() + 5)
+    x_values = data[x].to_numpy(dtype=float)
+    x_range = (np.nanmin(x_values), np.nanmax(x_values) + 5)
     plot: Figure = figure(x_range=x_range, **kwargs)
 
+    # keep every column, as hover tools added later (see `add_labels`) may show any
     source = ColumnDataSource(data)
 
     scatter_args = {
@@ -174,11 +198,14 @@ def add_means(
         Bokeh Figure used for chart.
     """
 
-    x_avgs = [data[x].mean()] * 2
-    x_lims = [data[y].min(), data[y].max()]
+    x_values = data[x].to_numpy(dtype=float)
+    y_values = data[y].to_numpy(dtype=float)
 
-    y_avgs = [data[y].mean()] * 2
-    y_lims = [data[x].min(), data[x].max()]
+    x_avgs = [np.nanmean(x_values)] * 2
+    x_lims = [np.nanmin(y_values), np.nanmax(y_values)]
+
+    y_avgs = [np.nanmean(y_values)] * 2
+    y_lims = [np.nanmin(x_values), np.nanmax(x_values)]
 
     plot.line(x_avgs, x_lims, line_dash="dashed", color="black")
     plot.line(y_lims, y_avgs, line_dash="dashed", color="black")
@@ -192,6 +219,7 @@ def add_labels(
     x: str,
     y: str,
     label: str = "player",
+    source: ColumnDataSource = None,
 ) -> Figure:
     """
     Add labels to a plot based on the column `label`. Scatter chart is interactive with
@@ -203,13 +231,18 @@ def add_labels(
         x: Column name for x variable.
         y: Column name for y variable.
         label: Column name determining drawn and hover tool label of scatter points.
+        source: Existing source holding `x`, `y` and `label`, such as that of the
+            scatter renderer in `plot.renderers[0].data_source`. Sharing it avoids
+            sending the same columns to the browser twice. Defaults to a new source
+            built from `data`.
         **kwargs: Passed to bokeh LabelSet.
 
     Returns:
         Bokeh Figure used for chart.
     """
 
-    source = ColumnDataSource(data)
+    if source is None:
+        source = _column_source(data, [x, y, label])
 
     plot.add_layout(
         LabelSet(
@@ -1,6 +1,7 @@
 from typing import Any, Dict, Sequence, Tuple, Union
 
 import matplotlib as mpl
+import numpy as np
 import pandas as pd
 from mplsoccer import Radar
 
@@ -9,6 +10,30 @@ from autoscout.util import get_record
 from autoscout.vis import constant
 
 
+def estimate_limits(
+    data: pd.DataFrame, columns: Sequence[str], alpha: float = 0.05
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate outer limits on a radar chart for each of `columns`, as the percentiles
+    over the whole DataFrame used by `plot_radar()` when limits are "auto". When
+    plotting many radars from the same data, compute these once and pass them as
+    `min_values` and `max_values`.
+
+    Args:
+        data: Data for all players or teams to consider.
+        columns: Columns to consider percentiles for.
+        alpha: Determines percentiles to consider. `alpha` of 0.05 results in 5th and
+            95th percentiles.
+
+    Returns:
+        Tuple of arrays of percentiles, `alpha` and `1 - alpha`, one value per column.
+    """
+
+    values = data[list(columns)].to_numpy(dtype=float)
+    lows, highs = np.nanquantile(values, (alpha, 1 - alpha), axis=0)
+    return lows, highs
+
+
 def estimate_limits_by_position(
     data: pd.DataFrame, column: str, position: str, alpha: float = 0.1
 ) -> Tuple[float, float]:
@@ -29,9 +54,39 @@ def estimate_limits_by_position(
         Tuple of percentiles, `alpha` and `1 - alpha`.
     """
 
-    data = data[data["position"].str.startswith(position)]
-    values = data[column].squeeze()
-    return values.quantile(alpha), values.quantile(1 - alpha)
+    return estimate_limits_by_position_many(data, [column], position, alpha)[column]
+
+
+def estimate_limits_by_position_many(
+    data: pd.DataFrame, columns: Sequence[str], position: str, alpha: float = 0.1
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Estimate radar limits for several `columns` at once, as in
+    `estimate_limits_by_position()`. Players in `position` are selected once and the
+    percentiles of every column are computed together, which is much faster than
+    estimating the limits of each column separately.
+
+    Args:
+        data: Data for all players to consider.
+        columns: Columns to consider percentiles for.
+        position: Position to consider players in when calculating percentiles.
+        alpha: Determines percentiles to consider. `alpha` of 0.1 results in 10th and
+            90th percentiles.
+
+    Returns:
+        Dict mapping each column to its tuple of percentiles, `alpha` and `1 - alpha`.
+    """
+
+    columns = list(columns)
+    # players without a position are not in any position
+    positions = data["position"].str.startswith(position, na=False)
+    in_position = positions.to_numpy(dtype=bool)
+    values = data[columns].to_numpy(dtype=float)[in_position]
+    lows, highs = np.nanquantile(values, (alpha, 1 - alpha), axis=0)
+
+    return {
+        col: (float(low), float(high)) for col, low, high in zip(columns, lows, highs)
+    }
 
 
 def plot_radar_from_config(
@@ -60,18 +115,23 @@ def plot_radar_from_config(
         Tuple of Radar, PyPlot Figure, and PyPlot Axes.
     """
 
-    columns, display, lib, mins, maxes, normalize = [], [], [], [], [], []
+    columns = list(config["columns"])
+    stat_configs = list(config["columns"].values())
 
-    for stat, stat_config in config["columns"].items():
-        columns.append(stat)
-        display.append(stat_config["display"])
-        mins.append(stat_config["low"])
-        maxes.append(stat_config["high"])
+    display = [stat_config["display"] for stat_config in stat_configs]
+    mins = [stat_config["low"] for stat_config in stat_configs]
+    maxes = [stat_config["high"] for stat_config in stat_configs]
 
-        if stat_config["lower_is_better"]:
-            lib.append(stat)
-        if stat_config["normalize"]:
-            normalize.append(stat)
+    lib = [
+        stat
+        for stat, stat_config in zip(columns, stat_configs)
+        if stat_config["lower_is_better"]
+    ]
+    normalize = [
+        stat
+        for stat, stat_config in zip(columns, stat_configs)
+        if stat_config["normalize"]
+    ]
 
     if normalize:
         data = preprocess.adjust_per_90(data, normalize)
@@ -116,8 +176,10 @@ def plot_radar(
         columns_display: Display names to replace column names with on the chart.
         lower_is_better: Names of columns for which lower should be considered better
             for the radar chart.
-        min_values: Min value to display on the chart for each column.
-        max_values: Max value to display on the chart for each column.
+        min_values: Min value to display on the chart for each column. Defaults to
+            the 5th percentile, see `estimate_limits()`.
+        max_values: Max value to display on the chart for each column. Defaults to
+            the 95th percentile.
         **kwargs: Passed to `mplsoccer.Radar.__init__()`.
 
     Returns:
@@ -126,16 +188,24 @@ def plot_radar(
 
     if columns_display:
         mapper = dict(zip(columns, columns_display))
-        data = data.rename(mapper, axis=1)
+        # only the labels change, so the column data is shared rather than copied
+        data = data.rename(columns=mapper, copy=False)
         columns = columns_display
 
         if lower_is_better:
             lower_is_better = [mapper[v] for v in lower_is_better]
 
-    if min_values == "auto":
-        min_values = data[columns].quantile(0.05)
-    if max_values == "auto":
-        max_values = data[columns].quantile(0.95)
+    # compare by type first, as limits may be arrays from `estimate_limits()`
+    auto_min = isinstance(min_values, str) and min_values == "auto"
+    auto_max = isinstance(max_values, str) and max_values == "auto"
+
+    if auto_min or auto_max:
+        low, high = estimate_limits(data, columns)
+
+        if auto_min:
+            min_values = low
+        if auto_max:
+            max_values = high
 
     radar = Radar(
         params=columns,
@@ -151,16 +221,17 @@ def plot_radar(
         ax=ax, facecolor=constant.RADAR_COLOURS[0], edgecolor=constant.RADAR_COLOURS[1]
     )
 
-    # Keep only the columns we want to plot
-    values = get_record(data, index)[columns].squeeze()
+    # Keep only the columns we want to plot, as a plain array for mplsoccer
+    values = get_record(data, index)[columns].to_numpy(dtype=float).reshape(-1)
 
     if index_compare:
         if index_compare == "average":
             # Compute average of the plotting columns across the whole dataset
-            values_compare = data[columns].mean(axis=0).squeeze()
+            values_compare = np.nanmean(data[columns].to_numpy(dtype=float), axis=0)
 
         else:
-            values_compare = get_record(data, index_compare)[columns].squeeze()
+            record = get_record(data, index_compare)
+            values_compare = record[columns].to_numpy(dtype=float).reshape(-1)
 
         radar.draw_radar_compare(
             values,
@@ -22,6 +22,9 @@ To download team data for the 2021-22 men's Premier League season::
 
 For stats against (rather than for) teams, simply append `--vs`.
 
+To write Parquet, which is smaller and much faster to load, rather than CSV, append
+`--format parquet`.
+
 The default configs (as used in the example usages above) are not mandatory. Using a
 file named `comps.json` and another named `stats.json`, you can determine which stats
 and competitions are pulled from `fbref.`
@@ -42,6 +45,7 @@ def download_data_for_comp(
     out_dir: Union[str, Path] = "data/fbref",
     dataset: str = "outfield",
     vs: bool = False,
+    file_type: str = "csv",
 ) -> None:
     df = aggregate.get_data(
         stats_config[dataset],
@@ -54,7 +58,7 @@ def download_data_for_comp(
     if dataset == "team":
         dataset += "_vs" if vs else "_for"
 
-    util.write_csv(df, out_dir, dataset, index=False)
+    util.write_table(df, out_dir, dataset, file_type=file_type, index=False)
 
 
 if __name__ == "__main__":
@@ -65,6 +69,7 @@ if __name__ == "__main__":
     parser.add_argument("--type", type=str, default="outfield")
     parser.add_argument("--vs", action="store_true")
     parser.add_argument("--season", type=str, default="current")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
     args = parser.parse_args()
 
     config_dir = Path(args.config)
@@ -88,4 +93,5 @@ if __name__ == "__main__":
         f"{args.out}/{args.competition}/{args.season}",
         dataset=args.type,
         vs=args.vs,
+        file_type=args.format,
     )
@@ -7,6 +7,8 @@ being pulled.
 
 The default configs are not mandatory. Using a file named `comps.json` and another
 named `stats.json`, you can determine which stats and competitions are pulled.
+
+To write Parquet rather than CSV, append `--format parquet`.
 """
 
 import argparse
@@ -23,6 +25,7 @@ if __name__ == "__main__":
     parser.add_argument("--out", type=str, default="data/fbref")
     parser.add_argument("--comp", type=str, default="eng1")
     parser.add_argument("--season", type=int, default=2022)
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
     args = parser.parse_args()
 
     config_dir = Path(args.config)
@@ -38,4 +41,4 @@ if __name__ == "__main__":
 
     out_dir = f"{args.out}/{args.comp}/{args.season}/"
 
-    util.write_csv(df, out_dir, "matches", index=False)
+    util.write_table(df, out_dir, "matches", file_type=args.format, index=False)
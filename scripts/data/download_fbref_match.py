@@ -6,6 +6,9 @@ being pulled, which must match one in the configs.
 
 For stats against (rather than for) teams, simply append `--vs`.
 
+To write Parquet, which is smaller and much faster to load, rather than CSV, append
+`--format parquet`.
+
 The default configs are not mandatory. Using a file named `matches.json` and another
 named `stats.json`, you can determine which stats and competitions are pulled.
 """
@@ -26,6 +29,7 @@ def download_matches_for_player_or_team(
     out_dir: Union[str, Path] = "data/fbref/match",
     team: bool = False,
     vs: bool = False,
+    file_type: str = "csv",
 ) -> None:
     df = match.get_data(
         stats_config["team" if team else "player"],
@@ -39,7 +43,7 @@ def download_matches_for_player_or_team(
     if team:
         name += "_vs" if vs else "_for"
 
-    util.write_csv(df, out_dir, name, index=False)
+    util.write_table(df, out_dir, name, file_type=file_type, index=False)
 
 
 if __name__ == "__main__":
@@ -49,6 +53,7 @@ if __name__ == "__main__":
     parser.add_argument("--dataset", "--data", type=str, default="manchester_united")
     parser.add_argument("--season", type=int, default=2022)
     parser.add_argument("--vs", action="store_true")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
     args = parser.parse_args()
 
     config_dir = Path(args.config)
@@ -71,4 +76,5 @@ if __name__ == "__main__":
         out_dir=f"{args.out}/{args.dataset}_{season}",
         team=team,
         vs=args.vs,
+        file_type=args.format,
     )
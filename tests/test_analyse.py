@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from autoscout import analyse
+
+
+def _elbow_strength_reference(ssd):
+    dx = -np.diff(ssd)
+    dx2 = -np.diff(dx)
+    dx = np.insert(dx, 0, [0])
+    dx2 = np.insert(dx2, 0, [0, 0])
+    return np.append(np.roll(dx2 - dx, -1)[:-1], [0])
+
+
+def test_pick_k_from_ssd_matches_reference():
+    rng = np.random.default_rng(0)
+    k_values = np.arange(3, 30)
+
+    for _ in range(20):
+        ssd = np.sort(rng.uniform(0, 100, len(k_values)))[::-1].copy()
+        strength = _elbow_strength_reference(ssd)
+
+        for relative in (True, False):
+            expected = np.argmax(strength / k_values if relative else strength)
+            assert analyse._pick_k_from_ssd(ssd, k_values, relative) == expected
+
+
+def test_pick_k_from_ssd_no_elbow():
+    ssd = np.array([40.0, 30.0, 20.0, 10.0])
+    assert analyse._pick_k_from_ssd(ssd, np.arange(3, 7)) is None
+
+
+def test_pick_k_from_ssd_too_few_k_values():
+    assert analyse._pick_k_from_ssd(np.array([5.0]), np.array([3])) is None
+    assert analyse._pick_k_from_ssd(np.array([]), np.array([], dtype=int)) is None
+    assert analyse._pick_k_from_ssd(np.array([5.0, 2.0]), np.array([3, 4])) is None
+
+
+def test_cluster_records_with_estimator_fitted_on_float32():
+    rng = np.random.default_rng(0)
+    columns = ["a", "b", "c"]
+    data = pd.DataFrame(rng.random((60, 3)).astype(np.float32), columns=columns)
+
+    for dtype in (np.float32, np.float64):
+        estimator = analyse.fit_kmeans(data.astype(dtype), columns, n_clusters=3)
+        clusters = analyse.cluster_records(data, columns, estimator=estimator)
+
+        assert clusters.shape == (60,)
+        assert set(clusters) <= {0, 1, 2}
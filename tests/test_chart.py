@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from autoscout.vis import chart
+
+
+def test_lines_trend_matches_least_squares_fit():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"match": np.arange(50.0), "xg": rng.normal(size=50).cumsum()})
+
+    plot = chart.lines(data, ["match"], ["xg"], ["red"], trends=True)
+
+    trend = np.asarray(plot.renderers[1].data_source.data["y"])
+    slope, intercept = np.polyfit(data["match"], data["xg"], deg=1)
+    np.testing.assert_allclose(trend, intercept + slope * data["match"])
+
+
+def test_lines_vshade_between_lines():
+    data = pd.DataFrame(
+        {
+            "match": [1.0, 2.0, 4.0, 5.0, 7.0, 8.0],
+            "for": [1.0, 2.0, 3.0, 2.0, 1.0, 0.0],
+            "vs": [2.0, 1.0, 1.0, 3.0, 3.0, 3.0],
+        }
+    )
+
+    plot = chart.lines(
+        data, ["match", "match"], ["for", "vs"], ["red", "blue"], vshade=(0, 1)
+    )
+
+    shades = plot.renderers[2:]
+    assert [r.glyph.hatch_color for r in shades] == ["blue", "red", "blue"]
+    assert [list(r.data_source.data["y1"]) for r in shades] == [
+        [1.0],
+        [1.0, 1.0],
+        [2.0, 1.0, 0.0],
+    ]
+    assert [list(r.data_source.data["x"]) for r in shades] == [
+        [1.0],
+        [2.0, 4.0],
+        [5.0, 7.0, 8.0],
+    ]
+
+
+def test_lines_source_holds_only_plotted_columns():
+    data = pd.DataFrame(
+        {"match": np.arange(3.0), "for": [1.0, 2.0, 3.0], "vs": [0.0, 1.0, 0.0], "x": 1}
+    )
+
+    plot = chart.lines(data, ["match", "match"], ["for", "vs"], ["red", "blue"])
+
+    assert set(plot.renderers[0].data_source.data) == {"match", "for", "vs"}
+
+
+def test_scatter_x_range_ignores_missing_values():
+    data = pd.DataFrame({"xg": [1.0, np.nan, 3.0], "goals": [0.0, 1.0, 2.0]})
+
+    plot = chart.scatter(data, "xg", "goals")
+
+    assert (plot.x_range.start, plot.x_range.end) == (1.0, 8.0)
+
+
+def test_add_labels_shares_scatter_source():
+    data = pd.DataFrame({"xg": [1.0, 3.0], "goals": [0.0, 2.0], "player": ["A", "B"]})
+
+    plot = chart.scatter(data, "xg", "goals")
+    source = plot.renderers[0].data_source
+    plot = chart.add_labels(plot, data, "xg", "goals", source=source)
+
+    assert plot.center[-1].source is source
@@ -0,0 +1,164 @@
+import pandas as pd
+from lxml import html
+
+from autoscout.data.fbref import aggregate, comp, match
+
+
+def _tbody(markup):
+    return html.fromstring(f"<table><tbody>{markup}</tbody></table>").find(".//tbody")
+
+
+def test_aggregate_get_data_from_table_player():
+    table = _tbody(
+        """
+        <tr><th scope="row" data-stat="ranker">1</th>
+            <td data-stat="player">Fred</td><td data-stat="minutes">1,234</td>
+            <td data-stat="goals"></td></tr>
+        <tr class="thead"><th data-stat="ranker">Rk</th></tr>
+        <tr><th scope="row" data-stat="ranker">2</th>
+            <td data-stat="player">Casemiro</td><td data-stat="minutes">900</td>
+            <td data-stat="goals">4</td></tr>
+        """
+    )
+
+    df = aggregate.get_data_from_table(["player", "minutes", "goals"], table)
+
+    assert df["player"].tolist() == ["Fred", "Casemiro"]
+    assert df["minutes"].tolist() == [1234.0, 900.0]
+    assert df["goals"].tolist() == [0.0, 4.0]
+
+
+def test_aggregate_get_data_from_table_team():
+    table = _tbody(
+        """
+        <tr><th scope="row" data-stat="team"> Arsenal </th>
+            <td data-stat="goals">88</td></tr>
+        """
+    )
+
+    df = aggregate.get_data_from_table(["goals"], table, team=True)
+
+    assert df["team"].tolist() == ["Arsenal"]
+    assert df["goals"].tolist() == [88.0]
+
+
+def test_comp_get_data_from_table():
+    table = _tbody(
+        """
+        <tr><th scope="row" data-stat="gameweek">1</th>
+            <td data-stat="date">2022-08-05</td><td data-stat="home_team">Palace</td>
+            <td data-stat="home_xg">1.2</td></tr>
+        """
+    )
+
+    df = comp.get_data_from_table(["home_team", "home_xg"], table)
+
+    assert df["date"].tolist() == [pd.Timestamp("2022-08-05")]
+    assert df["home_team"].tolist() == ["Palace"]
+    assert df["home_xg"].tolist() == [1.2]
+
+
+def test_match_get_data_from_table_skips_unplayed():
+    table = _tbody(
+        """
+        <tr><th scope="row" data-stat="date">2022-08-07</th>
+            <td data-stat="opponent">Brighton</td><td data-stat="goals_for">1</td>
+            <td data-stat="venue">Home</td></tr>
+        <tr><th scope="row" data-stat="date">2022-08-13</th>
+            <td data-stat="opponent">Brentford</td><td data-stat="goals_for"></td>
+            <td data-stat="venue">Away</td></tr>
+        """
+    )
+
+    df = match.get_data_from_table(["goals_for", "venue"], table)
+
+    assert df["date"].tolist() == [pd.Timestamp("2022-08-07")]
+    assert df["opponent"].tolist() == ["Brighton"]
+    assert df["goals_for"].tolist() == [1.0]
+    assert df["venue"].tolist() == ["Home"]
+
+
+def test_match_get_data_from_table_keeps_rows_without_goals():
+    table = _tbody(
+        """
+        <tr><th scope="row" data-stat="date">2022-08-07</th>
+            <td data-stat="opponent">Brighton</td><td data-stat="minutes">90</td>
+            <td data-stat="venue">Home</td></tr>
+        """
+    )
+
+    df = match.get_data_from_table(["minutes", "venue"], table)
+
+    assert df["opponent"].tolist() == ["Brighton"]
+    assert df["minutes"].tolist() == [90.0]
+
+
+def test_match_get_data_from_table_player_text_columns():
+    table = _tbody(
+        """
+        <tr><th scope="row" data-stat="date">2022-08-07</th>
+            <td data-stat="opponent">Brighton</td><td data-stat="goals_for">1</td>
+            <td data-stat="squad">Manchester Utd</td><td data-stat="position">CM</td>
+            <td data-stat="minutes">90</td></tr>
+        """
+    )
+
+    df = match.get_data_from_table(["squad", "position", "minutes"], table)
+
+    assert df["squad"].tolist() == ["Manchester Utd"]
+    assert df["position"].tolist() == ["CM"]
+    assert df["minutes"].tolist() == [90.0]
+
+
+def test_match_get_data_many_downloads_in_one_batch(monkeypatch):
+    batches = []
+
+    def get_all_tables_many(urls, *args):
+        batches.append(urls)
+        return dict.fromkeys(urls, ())
+
+    monkeypatch.setattr(match.scrape, "get_all_tables_many", get_all_tables_many)
+    monkeypatch.setattr(
+        match,
+        "get_data_for_category",
+        lambda category, top, end, features, **kwargs: pd.DataFrame(
+            {"opponent": ["Brighton"], category: [float(len(top))]}
+        ),
+    )
+
+    result = match.get_data_many(
+        {"summary": [], "passing": []}, [("a/", "/A", "A"), ("bb/", "/B", "B")]
+    )
+
+    assert batches == [
+        ["a/summary/A", "a/passing/A", "bb/summary/B", "bb/passing/B"]
+    ]
+    assert list(result) == ["A", "B"]
+    assert result["B"].columns.tolist() == ["opponent", "summary", "passing", "name"]
+    assert result["B"]["passing"].tolist() == [3.0]
+
+
+def test_match_get_data_many_uses_downloaded_tables(monkeypatch):
+    def get_all_tables_many(urls, *args):
+        return {
+            url: [
+                _tbody(
+                    f"""<tr><th scope="row" data-stat="date">2022-08-07</th>
+                    <td data-stat="opponent">{url}</td>
+                    <td data-stat="goals_for">1</td></tr>"""
+                )
+            ]
+            for url in urls
+        }
+
+    def get_all_tables(url):
+        raise AssertionError(f"{url} downloaded again")
+
+    monkeypatch.setattr(match.scrape, "get_all_tables_many", get_all_tables_many)
+    monkeypatch.setattr(match.scrape, "get_all_tables", get_all_tables)
+
+    sources = [(f"p{i}/", "/end", f"P{i}") for i in range(15)]
+    result = match.get_data_many({"summary": [], "passing": []}, sources)
+
+    assert len(result) == 15
+    assert result["P14"]["opponent"].tolist() == ["p14/summary/end"]
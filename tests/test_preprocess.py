@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from autoscout import preprocess
+
+
+def test_adjust_possession():
+    data_player = pd.DataFrame(
+        {
+            "date": ["2022-08-07", "2022-08-13", "2022-08-07"],
+            "squad": ["Arsenal", "Arsenal", "Chelsea"],
+            "tackles": [2.0, 4.0, 3.0],
+        },
+        index=[10, 11, 12],
+    )
+    data_team = pd.DataFrame(
+        {
+            "date": ["2022-08-07", "2022-08-07", "2022-08-13"],
+            "name": ["Chelsea", "Arsenal", "Arsenal"],
+            "possession": [50.0, 60.0, 40.0],
+        }
+    )
+
+    result = preprocess.adjust_possession(data_player, data_team, ["tackles"])
+
+    expected = preprocess.adjust_possession_def(
+        np.array([[2.0], [4.0], [3.0]]), np.array([60.0, 40.0, 50.0])
+    )
+    np.testing.assert_allclose(result["padj_tackles"], expected[:, 0], rtol=1e-6)
+    assert result.index.tolist() == [10, 11, 12]
+    assert "padj_tackles" not in data_player.columns
+
+
+def test_rolling():
+    data = pd.DataFrame({"goals": [1.0, 0.0, 2.0, np.nan, 3.0], "xg": range(5)})
+
+    result = preprocess.rolling(data, ["goals", "xg"], roll_length=3, min_periods=2)
+
+    assert result["goals_roll_mean"].tolist() == [0.5, 0.5, 1.0, 1.0, 2.5]
+    assert result["xg_roll_mean"].tolist() == [0.5, 0.5, 1.0, 2.0, 3.0]
+    assert "goals_roll_mean" not in data.columns
+
+
+def test_adjust_per_90_and_clamp_leave_input_unchanged():
+    data = pd.DataFrame(
+        {"minutes": [90.0, 180.0, 45.0], "goals": [1.0, 1.0, 3.0], "team": "X"}
+    )
+    original = data.copy()
+
+    per_90 = preprocess.adjust_per_90(data, ["goals"])
+    clamped = preprocess.clamp_by_percentiles(per_90, ["goals"], alpha=0.25)
+
+    np.testing.assert_allclose(per_90["goals"], [1.0, 0.5, 6.0], rtol=1e-6)
+    np.testing.assert_allclose(clamped["goals"], [1.0, 0.75, 3.5], rtol=1e-6)
+    np.testing.assert_allclose(per_90["goals"], [1.0, 0.5, 6.0], rtol=1e-6)
+    assert per_90["goals"].dtype == np.float32
+    pd.testing.assert_frame_equal(data, original)
+
+
+def test_filter_categories():
+    data = pd.DataFrame(columns=["player", "goals", "xg", "passes", "tackles"])
+    config = {"shooting": ["goals", "xg"], "passing": ["passes", "key_passes"]}
+
+    retained = preprocess.filter_categories(data, config, "shooting")
+    dropped = preprocess.filter_categories(data, config, ["passing"], retain=False)
+
+    assert retained.columns.tolist() == ["goals", "xg"]
+    assert dropped.columns.tolist() == ["player", "goals", "xg", "tackles"]
@@ -0,0 +1,104 @@
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+
+from autoscout.vis import radar
+
+matplotlib.use("Agg")
+
+COLUMNS = ["goals", "assists", "tackles"]
+
+
+def _players(n: int = 40) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.random((n, len(COLUMNS))), columns=COLUMNS)
+    data.insert(0, "player", [f"P{i}" for i in range(n)])
+    return data
+
+
+def test_plot_radar_auto_limits():
+    data = _players()
+    data.loc[3, "goals"] = np.nan
+
+    plot, fig, _ = radar.plot_radar(data, COLUMNS, "P0")
+    plt.close(fig)
+
+    np.testing.assert_allclose(plot.min_range, data[COLUMNS].quantile(0.05))
+    np.testing.assert_allclose(plot.max_range, data[COLUMNS].quantile(0.95))
+
+
+def test_estimate_limits_by_position():
+    data = _players()
+    data["position"] = ["DF", "MF,FW"] * 20
+
+    low, high = radar.estimate_limits_by_position(data, "goals", "MF")
+
+    midfield = data.loc[data["position"] == "MF,FW", "goals"]
+    np.testing.assert_allclose((low, high), midfield.quantile([0.1, 0.9]))
+
+
+def test_estimate_limits_by_position_many():
+    data = _players()
+    data["position"] = ["DF", "MF,FW"] * 20
+
+    limits = radar.estimate_limits_by_position_many(data, COLUMNS, "DF", alpha=0.2)
+
+    assert list(limits) == COLUMNS
+    for col in COLUMNS:
+        assert limits[col] == radar.estimate_limits_by_position(data, col, "DF", 0.2)
+
+
+def test_plot_radar_from_config():
+    data = _players()
+    data["minutes"] = 180.0
+    stat_config = {"low": 0.0, "high": 2.0, "lower_is_better": False, "normalize": True}
+    config = {
+        "columns": {
+            "goals": {**stat_config, "display": "Goals"},
+            "assists": {**stat_config, "display": "Assists"},
+            "tackles": {**stat_config, "display": "Tackles", "lower_is_better": True},
+        }
+    }
+
+    plot, fig, _ = radar.plot_radar_from_config(data, config, "P0")
+    plt.close(fig)
+
+    assert list(plot.params) == ["Goals", "Assists", "Tackles"]
+    assert list(plot.lower_is_better) == ["Tackles"]
+    assert list(plot.min_range) == [0.0, 0.0, 2.0]
+
+
+def test_plot_radar_compare_with_average():
+    data = _players()
+
+    for index in ("P1", 1):
+        plot, fig, _ = radar.plot_radar(data, COLUMNS, index, index_compare="average")
+        plt.close(fig)
+
+        assert len(plot.params) == len(COLUMNS)
+
+
+def test_estimate_limits_reused_across_radars():
+    data = _players()
+    mins, maxes = radar.estimate_limits(data, COLUMNS)
+
+    plot, fig, _ = radar.plot_radar(
+        data, COLUMNS, "P2", min_values=mins, max_values=maxes
+    )
+    plt.close(fig)
+
+    np.testing.assert_allclose(mins, data[COLUMNS].quantile(0.05))
+    np.testing.assert_allclose(plot.max_range, maxes)
+
+
+def test_estimate_limits_by_position_ignores_missing_positions():
+    data = _players()
+    data["position"] = ["DF", "MF"] * 20
+    data.loc[:9, "position"] = np.nan
+    data.loc[:9, "goals"] = 100.0
+
+    limits = radar.estimate_limits_by_position_many(data, ["goals"], "DF")
+
+    defenders = data.loc[data["position"] == "DF", "goals"]
+    np.testing.assert_allclose(limits["goals"], defenders.quantile([0.1, 0.9]))
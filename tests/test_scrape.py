@@ -0,0 +1,115 @@
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+from requests import Request, Response
+from requests_cache import CachedSession
+
+from autoscout.data import scrape
+
+PAGE = """
+<html><body>
+<table><tbody><tr><td>visible</td></tr></tbody></table>
+<div><!--
+<table><tbody><tr><td>commenté</td></tr></tbody></table>
+--></div>
+</body></html>
+"""
+RESPONSE = SimpleNamespace(content=PAGE.encode("utf-8"), encoding=None)
+
+
+class FakeSession:
+    def __init__(self):
+        self.requested = []
+
+    def get(self, url):
+        self.requested.append(url)
+        return RESPONSE
+
+
+def test_get_all_tables_includes_commented_tables(monkeypatch):
+    monkeypatch.setattr(scrape, "get_session", lambda: FakeSession())
+
+    tables = scrape.get_all_tables("https://example.com/test_get_all_tables")
+
+    assert [t.text_content() for t in tables] == ["visible", "commenté"]
+
+
+def test_get_all_tables_many_downloads_each_url_once(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(scrape, "get_session", lambda: session)
+    monkeypatch.setattr(scrape, "_cached_response", lambda url: None)
+
+    urls = [f"https://example.com/test_get_all_tables_many/{i}" for i in (1, 2, 1)]
+    tables = scrape.get_all_tables_many(urls, sleep_seconds=0)
+
+    assert sorted(session.requested) == sorted(set(urls))
+    assert list(tables) == urls[:2]
+    assert all(len(t) == 2 for t in tables.values())
+
+
+def test_get_all_tables_many_shares_rate_limit_between_batches(monkeypatch):
+    monkeypatch.setattr(scrape, "get_session", lambda: FakeSession())
+    monkeypatch.setattr(scrape, "_cached_response", lambda url: None)
+
+    start = time.monotonic()
+    for i in range(2):
+        scrape.get_all_tables_many(
+            [f"https://example.com/test_shares_rate_limit/{i}"], sleep_seconds=0.3
+        )
+
+    assert time.monotonic() - start >= 0.3
+
+
+def test_get_all_tables_many_does_not_wait_for_cached_pages(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(scrape, "get_session", lambda: session)
+    monkeypatch.setattr(
+        scrape,
+        "_cached_response",
+        lambda url: RESPONSE if url.endswith("/cached") else None,
+    )
+
+    parsed = "https://example.com/test_cached_pages/parsed"
+    scrape.get_all_tables(parsed)
+    urls = [f"https://example.com/test_cached_pages/{i}/cached" for i in range(4)]
+
+    start = time.monotonic()
+    scrape.get_all_tables_many([parsed, *urls], sleep_seconds=1)
+
+    assert time.monotonic() - start < 0.5
+    assert session.requested == [parsed]
+
+
+def test_get_all_tables_keeps_only_recent_pages(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(scrape, "get_session", lambda: session)
+
+    urls = [f"https://example.com/test_keeps_recent/{i}" for i in range(10)]
+    for url in [*urls, urls[-1], urls[0]]:
+        scrape.get_all_tables(url)
+
+    assert len(scrape._TABLES_CACHE) == scrape.TABLES_CACHE_SIZE
+    assert session.requested == [*urls, urls[0]]
+
+
+def test_import_does_not_create_cache_file(tmp_path):
+    code = "import autoscout.data.scrape"
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True)
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_cached_response(monkeypatch):
+    session = CachedSession(backend="memory")
+    monkeypatch.setattr(scrape, "get_session", lambda: session)
+
+    url = "https://example.com/test_cached_response"
+    response = Response()
+    response.status_code, response._content = 200, b""
+    response.request = session.prepare_request(Request("GET", url))
+    session.cache.save_response(response, session.cache.create_key(response.request))
+
+    assert scrape._cached_response(url).status_code == 200
+    assert scrape._cached_response(f"{url}/other") is None
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from autoscout import search
+
+
+def _players():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "player": [f"Player {i}" for i in range(50)],
+            "minutes": rng.uniform(500, 3000, 50),
+            "goals": rng.uniform(0, 20, 50),
+            "assists": rng.uniform(0, 10, 50),
+        },
+        index=range(100, 150),
+    )
+
+
+def test_search_similar():
+    data = _players()
+    columns = ["goals", "assists"]
+
+    result = search.search_similar(data, columns, "Player 7", num=4)
+
+    scaled = (data[columns] - data[columns].min()) / (
+        data[columns].max() - data[columns].min()
+    )
+    distances = np.linalg.norm(scaled - scaled.loc[107], axis=1)
+    expected = data.index[np.argsort(distances, kind="stable")[:4]]
+    assert result.index.tolist() == expected.tolist()
+    assert result.index[0] == 107
+
+
+def test_search_similar_int_index():
+    data = _players()
+
+    result = search.search_similar(data, ["goals", "assists"], 3, num=60)
+
+    assert len(result) == 50
+    assert result.index[0] == 103
+
+
+def test_search():
+    data = pd.DataFrame(
+        {"angles": [0, 3, 4, np.nan], "degrees": [360, 180, 360, 360]},
+        index=["circle", "triangle", "rectangle", "unknown"],
+    )
+
+    result = search.search(data, {"gte": {"angles": 1}, "eq": {"degrees": 360}})
+
+    assert result.index.tolist() == ["rectangle"]
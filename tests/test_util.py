@@ -1,3 +1,11 @@
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import minmax_scale
+
 from autoscout import util
 
 
@@ -5,3 +13,100 @@ def test_sleep_and_return():
     value = 1.011
     result = util.sleep_and_return(value, 0.01)
     assert value == result
+
+
+def test_rate_limited():
+    calls = []
+    limited = util.rate_limited(calls.append, 0.05)
+
+    start = time.monotonic()
+    for i in range(3):
+        limited(i)
+
+    assert calls == [0, 1, 2]
+    assert time.monotonic() - start >= 0.1
+
+
+def test_to_categorical():
+    df = pd.DataFrame(
+        {"player": ["A", "B", "C", "D"], "team": ["X", "X", "Y", "Y"], "goals": 1.0}
+    )
+
+    result = util.to_categorical(df, ["player", "team", "nationality"])
+
+    assert result["player"].dtype == object
+    assert result["team"].dtype == "category"
+    assert result["team"].tolist() == ["X", "X", "Y", "Y"]
+    assert df["team"].dtype == object
+
+
+def test_write_parquet(tmp_path):
+    df = pd.DataFrame({"team": pd.Categorical(["X", "Y"]), "goals": [1.0, 2.0]})
+
+    out_path = util.write_parquet(df, tmp_path / "out", "team_for", index=False)
+
+    assert out_path == tmp_path / "out" / "team_for.parquet"
+    pd.testing.assert_frame_equal(pd.read_parquet(out_path), df)
+
+
+def test_get_record():
+    df = pd.DataFrame(
+        {
+            "player": ["Fred", "Casemiro", "Fred"],
+            "minutes": [900.0, 1800.0, 2700.0],
+        },
+        index=["a", "b", "c"],
+    )
+
+    assert util.get_record(df, 1).name == "b"
+    assert util.get_record(df, "Fred").name == "c"
+    assert util.get_record(df, "Casemiro").index.tolist() == ["b"]
+    assert util.get_record(df, "Antony").empty
+
+
+def test_write_and_load_table(tmp_path):
+    df = pd.DataFrame({"team": ["X", "Y"], "goals": [1.0, 2.0]})
+
+    for file_type in ("parquet", "csv"):
+        out_path = util.write_table(df, tmp_path, "team", file_type, index=False)
+
+        assert out_path.suffix == f".{file_type}"
+        pd.testing.assert_frame_equal(util.load_table(out_path), df)
+        assert util.load_table(out_path, format="polars").to_pandas().equals(df)
+
+
+def test_load_json(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text('{"shooting": ["goals", "xg"], "name": "Müller"}', encoding="utf-8")
+
+    assert util.load_json(path) == {"shooting": ["goals", "xg"], "name": "Müller"}
+
+
+def test_load_csv(tmp_path):
+    path = tmp_path / "team.csv"
+    path.write_text("date,team,goals\n2022-08-07,X,1\n2022-08-13,Y,\n")
+
+    df = util.load_csv(path, engine="pyarrow")
+    lazy = util.load_csv(path, format="polars", lazy=True)
+
+    assert df["goals"].isna().tolist() == [False, True]
+    assert lazy.select("team").collect()["team"].to_list() == ["X", "Y"]
+
+
+def test_min_max_scale():
+    df = pd.DataFrame(
+        {"goals": [1.0, 3.0, np.nan, 2.0], "games": 10, "team": ["X", "Y", "Y", "X"]}
+    )
+
+    result = util.min_max_scale(df, ["goals", "games"])
+
+    np.testing.assert_allclose(result["goals"], minmax_scale(df["goals"]), rtol=1e-6)
+    assert result["games"].tolist() == [0.0] * 4
+    assert result["goals"].dtype == np.float32
+    assert util.min_max_scale(df, ["goals"], dtype=float)["goals"].dtype == np.float64
+    assert df["goals"].tolist()[:2] == [1.0, 3.0]
+
+
+def test_import_does_not_load_polars():
+    code = "import sys, autoscout.util; assert 'polars' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)